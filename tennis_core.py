@@ -0,0 +1,212 @@
+"""
+Tennis court scheduling core: database access, password hashing and
+reservation logic, kept free of UI session state so scripts and admin
+tools can use it alongside the Streamlit app.
+
+Reads are cached per process for 30 seconds. A write from another
+process, such as an admin script, cannot clear the server's caches, so
+the app may show stale reservations until that TTL expires.
+"""
+
+import streamlit as st
+import hmac
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from hashlib import sha256
+from contextlib import contextmanager
+from typing import Optional
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Configuration
+DB_PATH = "tennis_schedule.db"
+TIME_SLOTS = (
+    "06:00", "07:00", "08:00", "09:00", "10:00", "11:00",
+    "12:00", "13:00", "14:00", "15:00", "16:00", "17:00",
+    "18:00", "19:00", "20:00", "21:00"
+)
+PASSWORD_CACHE_SIZE = 32  # Password checks remembered per cache
+
+
+@st.cache_resource
+def _get_conn() -> sqlite3.Connection:
+    """Open the shared database connection once per process."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-8000")
+    return conn
+
+
+@st.cache_resource
+def _get_db_lock() -> threading.Lock:
+    """Lock serializing use of the shared connection across sessions."""
+    return threading.Lock()
+
+
+@contextmanager
+def get_db():
+    """Context manager for the shared database connection."""
+    with _get_db_lock():
+        yield _get_conn()
+
+
+def init_db():
+    """Initialize the database with the reservations table."""
+    with get_db() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS reservations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                time_slot TEXT NOT NULL,
+                player_name TEXT NOT NULL,
+                phone TEXT,
+                password_hash TEXT,
+                created_at REAL NOT NULL,
+                UNIQUE(date, time_slot)
+            )
+        """)
+
+
+# Argon2id at the OWASP-recommended minimum cost
+_PH = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+
+def hash_password(password: str) -> str:
+    """Hash a password for storage."""
+    return _PH.hash(password)
+
+
+def verify_password(password: str, stored_hash: str,
+                    cache: Optional[OrderedDict] = None) -> bool:
+    """Check a password against a stored hash, remembering results in `cache` if given."""
+    # Key on a digest so the cache never holds plaintext passwords
+    key = (stored_hash, sha256(password.encode()).digest())
+    if cache is not None and key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    if stored_hash.startswith("$argon2"):
+        try:
+            valid = _PH.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            valid = False
+    else:
+        # Legacy rows store an unsalted SHA-256 hex digest
+        valid = hmac.compare_digest(sha256(password.encode()).hexdigest(), stored_hash)
+
+    if cache is not None:
+        cache[key] = valid
+        if len(cache) > PASSWORD_CACHE_SIZE:
+            cache.popitem(last=False)
+    return valid
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_reservations(date: str) -> dict:
+    """Get all reservations for a given date as {time_slot: (player_name, is_locked)}."""
+    with get_db() as conn:
+        rows = conn.execute(
+            """SELECT time_slot, player_name, password_hash IS NOT NULL AS is_locked
+               FROM reservations WHERE date = ?""",
+            (date,)
+        ).fetchall()
+    return {time_slot: (player_name, bool(is_locked)) for time_slot, player_name, is_locked in rows}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_all_reservations_in_range(start_date: str, end_date: str) -> dict:
+    """Get all reservations in a date range as {date: {time_slot: (player_name, is_locked)}}."""
+    with get_db() as conn:
+        rows = conn.execute(
+            """SELECT date, time_slot, player_name, password_hash IS NOT NULL AS is_locked
+               FROM reservations WHERE date BETWEEN ? AND ?""",
+            (start_date, end_date)
+        ).fetchall()
+    # Plain tuples rather than sqlite3.Row, which st.cache_data can't pickle
+    result = defaultdict(dict)
+    for date, time_slot, player_name, is_locked in rows:
+        result[date][time_slot] = (player_name, bool(is_locked))
+    return dict(result)
+
+
+def invalidate_reservation_caches():
+    """Invalidate this process's cached reservation data after a write."""
+    get_reservations.clear()
+    get_all_reservations_in_range.clear()
+
+
+def create_reservation(date: str, time_slot: str, player_name: str,
+                       phone: str = "", password: str = "") -> tuple[bool, str]:
+    """Create a new reservation. Returns (success, message)."""
+    success, message = create_reservations([(date, time_slot, player_name, phone, password)])
+    if success:
+        return True, "Reservation created successfully!"
+    return False, message
+
+
+def create_reservations(rows: list[tuple[str, str, str, str, str]]) -> tuple[bool, str]:
+    """Create several reservations, all or none. Returns (success, message).
+
+    Each row is (date, time_slot, player_name, phone, password).
+    """
+    # Do the slow work before taking the connection lock
+    password_hashes = {pw: hash_password(pw) for _, _, _, _, pw in rows if pw}
+    created_at = time.time()
+    params = [
+        (date, time_slot, player_name, phone, password_hashes.get(password), created_at)
+        for date, time_slot, player_name, phone, password in rows
+    ]
+
+    try:
+        with get_db() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            with conn:
+                conn.executemany(
+                    """INSERT INTO reservations (date, time_slot, player_name, phone, password_hash, created_at)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    params
+                )
+        invalidate_reservation_caches()
+        return True, "Reservations created successfully!"
+    except sqlite3.IntegrityError:
+        return False, "This time slot is already booked."
+
+
+def cancel_reservation(date: str, time_slot: str, password: str = "",
+                       password_cache: Optional[OrderedDict] = None) -> tuple[bool, str]:
+    """Cancel a reservation. Returns (success, message).
+
+    `password_cache` is passed through to verify_password.
+    """
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT id, password_hash FROM reservations WHERE date = ? AND time_slot = ?",
+            (date, time_slot)
+        ).fetchone()
+
+    if not row:
+        return False, "No reservation found for this time slot."
+
+    # Check password if one was set, outside the lock since Argon2 is slow
+    if row["password_hash"]:
+        if not password:
+            return False, "This reservation is password protected. Please enter the password."
+        if not verify_password(password, row["password_hash"], password_cache):
+            return False, "Incorrect password."
+
+    # Only delete the row we checked; it may have been rebooked in the meantime
+    with get_db() as conn:
+        deleted = conn.execute(
+            "DELETE FROM reservations WHERE id = ? AND password_hash IS ?",
+            (row["id"], row["password_hash"])
+        ).rowcount
+    if not deleted:
+        return False, "No reservation found for this time slot."
+    invalidate_reservation_caches()
+    return True, "Reservation cancelled successfully!"
@@ -0,0 +1,144 @@
+"""
+Caparra Hills theme: styles and HTML templates for the schedule UI.
+
+Kept out of app.py, which Streamlit re-executes on every rerun, so these
+strings are built once when the module is first imported.
+"""
+
+from tennis_core import TIME_SLOTS
+
+# Caparra Hills color palette - tropical elegance
+COLORS = {
+    "primary_green": "#1B4D3E",      # Deep forest green
+    "light_green": "#2D6A4F",        # Tropical green
+    "accent_gold": "#D4A853",        # Warm gold
+    "cream": "#F5F1E6",              # Elegant cream
+    "terracotta": "#C67B5C",         # Warm terracotta
+    "available": "#E8F5E9",          # Soft mint green
+    "available_border": "#4CAF50",   # Fresh green
+    "booked": "#FFEBEE",             # Soft coral
+    "booked_border": "#C67B5C",      # Terracotta
+}
+
+# Custom CSS for Caparra Hills tropical elegance theme
+THEME_CSS = f"""
+    <style>
+    /* Main header styling */
+    .main-header {{
+        background: linear-gradient(135deg, {COLORS["primary_green"]} 0%, {COLORS["light_green"]} 100%);
+        padding: 1.5rem 2rem;
+        border-radius: 12px;
+        margin-bottom: 1rem;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }}
+    .main-header h1 {{
+        color: {COLORS["cream"]};
+        margin: 0;
+        font-size: 2rem;
+        font-weight: 600;
+    }}
+    .main-header .location {{
+        color: {COLORS["accent_gold"]};
+        font-size: 1.1rem;
+        margin-top: 0.25rem;
+    }}
+
+    /* Tab styling */
+    .stTabs [data-baseweb="tab-list"] {{
+        gap: 8px;
+        background-color: {COLORS["cream"]};
+        padding: 0.5rem;
+        border-radius: 10px;
+    }}
+    .stTabs [data-baseweb="tab"] {{
+        background-color: white;
+        border-radius: 8px;
+        color: {COLORS["primary_green"]};
+        font-weight: 500;
+    }}
+    .stTabs [aria-selected="true"] {{
+        background-color: {COLORS["primary_green"]} !important;
+        color: {COLORS["cream"]} !important;
+    }}
+
+    /* Button styling */
+    .stButton > button {{
+        background: linear-gradient(135deg, {COLORS["primary_green"]} 0%, {COLORS["light_green"]} 100%);
+        color: {COLORS["cream"]};
+        border: none;
+        font-weight: 500;
+        transition: all 0.3s ease;
+    }}
+    .stButton > button:hover {{
+        background: linear-gradient(135deg, {COLORS["light_green"]} 0%, {COLORS["primary_green"]} 100%);
+        box-shadow: 0 4px 12px rgba(27, 77, 62, 0.3);
+    }}
+
+    /* Footer styling */
+    .footer {{
+        background: linear-gradient(135deg, {COLORS["primary_green"]} 0%, {COLORS["light_green"]} 100%);
+        padding: 1rem;
+        border-radius: 10px;
+        text-align: center;
+        margin-top: 2rem;
+    }}
+    .footer p {{
+        color: {COLORS["cream"]};
+        margin: 0;
+        font-size: 0.9rem;
+    }}
+    .footer .gold {{
+        color: {COLORS["accent_gold"]};
+    }}
+
+    /* Schedule grid styling */
+    .day-header {{
+        background-color: {COLORS["primary_green"]};
+        color: {COLORS["cream"]};
+        padding: 8px;
+        border-radius: 8px;
+        text-align: center;
+        margin-bottom: 8px;
+    }}
+    .day-header span {{
+        color: {COLORS["accent_gold"]};
+    }}
+    .slot-booked, .slot-available {{
+        padding: 6px 8px;
+        margin: 3px 0;
+        border-radius: 6px;
+        font-size: 12px;
+        box-shadow: 0 1px 3px rgba(0,0,0,0.08);
+    }}
+    .slot-booked {{
+        background-color: {COLORS["booked"]};
+        border-left: 3px solid {COLORS["booked_border"]};
+    }}
+    .slot-booked b {{
+        color: {COLORS["terracotta"]};
+    }}
+    .slot-booked span {{
+        color: #555;
+    }}
+    .slot-available {{
+        background-color: {COLORS["available"]};
+        border-left: 3px solid {COLORS["available_border"]};
+    }}
+    .slot-available b {{
+        color: {COLORS["primary_green"]};
+    }}
+    .slot-available span {{
+        color: {COLORS["light_green"]};
+    }}
+    </style>
+"""
+
+# Schedule grid HTML templates, styled by the classes in THEME_CSS
+DAY_HEADER_TPL = "<div class='day-header'><b>%(day_name)s</b><br><span>%(day)s</span></div>"
+BOOKED_TPL = (
+    "<div class='slot-booked'><b>%(time_slot)s</b> %(locked)s<br>"
+    "<span>%(name)s</span></div>"
+)
+_AVAILABLE_TPL = "<div class='slot-available'><b>%(time_slot)s</b><br><span>Disponible</span></div>"
+# Available cells only vary by slot, so render them all up front
+AVAILABLE_CELLS = {t: _AVAILABLE_TPL % {"time_slot": t} for t in TIME_SLOTS}